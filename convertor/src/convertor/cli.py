@@ -23,10 +23,14 @@ logger = logging.getLogger("convertor")
 def find_volume_dirs(root: Path) -> list[Path]:
     """Return immediate subdirectories of `root` that look like volume dirs.
 
-    For now we consider every directory directly under `root` as a candidate volume directory.
-    More advanced heuristics (match `vNN` suffix) can be added later.
+    For now we consider every non-hidden directory directly under `root` as a
+    candidate volume directory; dot-directories (such as packer's
+    `.packer-discard-*` leftovers) are skipped. More advanced heuristics
+    (match `vNN` suffix) can be added later.
     """
-    return [p for p in sorted(root.iterdir()) if p.is_dir()]
+    return [
+        p for p in sorted(root.iterdir()) if p.is_dir() and not p.name.startswith(".")
+    ]
 
 
 def _build_parser() -> argparse.ArgumentParser:
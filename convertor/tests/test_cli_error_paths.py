@@ -30,6 +30,13 @@ def test_empty_root_returns_success(tmp_path: Path):
     assert rc == 0
 
 
+def test_find_volume_dirs_skips_hidden_dirs(tmp_path: Path):
+    (tmp_path / "Manga v01").mkdir()
+    (tmp_path / ".packer-discard-Chapter 001-x").mkdir()
+    (tmp_path / "notes.txt").write_text("")
+    assert convertor.cli.find_volume_dirs(tmp_path) == [tmp_path / "Manga v01"]
+
+
 # ---------------------------------------------------------------------------
 # lines 126-128: force_regen removes existing output before converting
 # ---------------------------------------------------------------------------
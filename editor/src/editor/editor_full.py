@@ -4,16 +4,33 @@ from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 
 import yaml
 
-from .epub_metadata import EPUBMetadata  # noqa: F401 — re-exported for callers
+from .epub_metadata import (  # noqa: F401 — EPUBMetadata re-exported for callers
+    EPUBMetadata,
+    OPFOnlyMetadata,
+)
 from .exit_codes import ERROR, SUCCESS
 
 logger = logging.getLogger(__name__)
 
 
+# Ordered by precedence. `[^\S\n]` instead of `\s` (and MULTILINE anchors) so
+# the patterns never cross the newline separator used by parse_volume_numbers.
+_VOLUME_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE | re.MULTILINE)
+    for p in (
+        r"v(?:ol)?\.?[^\S\n]*(\d+)",  # v01, vol 01, vol.01
+        r"(?:^|[^\S\n])(\d+)(?:\.|$)",  # Just number
+        r"volume[^\S\n]*(\d+)",  # volume 01
+    )
+)
+
+
 def parse_volume_number(filename: str) -> int | None:
     """Extract volume number from filename.
 
@@ -22,20 +39,35 @@ def parse_volume_number(filename: str) -> int | None:
         'Series Name 05.kepub.epub' -> 5
         'Volume 12.epub' -> 12
     """
-    patterns = [
-        r"v(?:ol)?\.?\s*(\d+)",  # v01, vol 01, vol.01
-        r"(?:^|\s)(\d+)(?:\.|$)",  # Just number
-        r"volume\s*(\d+)",  # volume 01
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
+    for pattern in _VOLUME_PATTERNS:
+        match = pattern.search(filename)
         if match:
             return int(match.group(1))
 
     return None
 
 
+def parse_volume_numbers(filenames: list[str]) -> list[int | None]:
+    """Batch form of :func:`parse_volume_number`, one result per filename.
+
+    Each pattern runs once over the newline-joined names rather than once per
+    name; a later pattern only fills names the earlier ones left unmatched, so
+    precedence is the same as calling ``parse_volume_number`` in a loop.
+    """
+    if any("\n" in name for name in filenames):
+        return [parse_volume_number(name) for name in filenames]
+
+    joined = "\n".join(filenames)
+    starts = list(accumulate((len(n) + 1 for n in filenames[:-1]), initial=0))
+    results: list[int | None] = [None] * len(filenames)
+    for pattern in _VOLUME_PATTERNS:
+        for match in pattern.finditer(joined):
+            idx = bisect_right(starts, match.start(1)) - 1
+            if results[idx] is None:
+                results[idx] = int(match.group(1))
+    return results
+
+
 def load_yaml_metadata(yaml_path: Path) -> dict:
     """Load metadata from YAML file."""
     with yaml_path.open("r", encoding="utf-8") as f:
@@ -262,8 +294,8 @@ def inject_metadata(
     error_count = 0
     toc_count = 0
 
-    for epub_file in epub_files:
-        vol_num = parse_volume_number(epub_file.name)
+    vol_nums = parse_volume_numbers([p.name for p in epub_files])
+    for epub_file, vol_num in zip(epub_files, vol_nums):
         if vol_num is None:
             logger.warning(f"Could not parse volume number from: {epub_file.name}")
             continue
@@ -338,13 +370,13 @@ def dump_metadata(path: Path, output_path: Path | None = None, locale: str = "en
     genre: list[str] | None = None
     language = None
 
-    for epub_file in epub_files:
+    vol_nums = parse_volume_numbers([p.name for p in epub_files])
+    for epub_file, vol_num in zip(epub_files, vol_nums):
         try:
-            vol_num = parse_volume_number(epub_file.name)
-
             logger.info(f"Reading: {epub_file.name}")
 
-            epub_meta = EPUBMetadata(epub_file)
+            # Read-only: parse just the OPF rather than the whole EPUB.
+            epub_meta = OPFOnlyMetadata(epub_file)
             meta = epub_meta.get_metadata()
 
             if not series_name and meta.get("series"):
@@ -482,6 +514,7 @@ def clear_metadata(path: Path, dry_run: bool = False) -> int:
                 date="",
                 isbn="",
                 publisher="",
+                language="",
             )
             epub_meta.save()
             logger.info(f"  ✓ Cleared metadata from {epub_file.name}")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import sys
+import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_OPF_NS = "http://www.idpf.org/2007/opf"
+_CONTAINER_NS = "urn:oasis:names:tc:opendocument:xmlns:container"
+
 
 def _dc_scalar(dc: dict, field: str) -> str | None:
     """Return the first scalar value for a Dublin Core field, or None.
@@ -31,6 +36,82 @@ def _dc_scalar(dc: dict, field: str) -> str | None:
     return entry[0] if isinstance(entry, tuple) else entry
 
 
+def _has_metadata(metadata: dict) -> bool:
+    """Return True when *metadata* carries a calibre series or title + creator.
+
+    *metadata* uses ebooklib's ``{namespace: {tag: [(value, attrs), ...]}}``
+    layout, shared by ``EPUBMetadata`` and ``OPFOnlyMetadata``.
+    """
+    meta = metadata.get(_OPF_NS, {})
+
+    for item in meta.get("meta", []):
+        if isinstance(item, tuple) and len(item) >= 2:
+            attrs = item[1] if len(item) > 1 else {}
+            if isinstance(attrs, dict):
+                if attrs.get("name") == "calibre:series":
+                    return True
+
+    dc_meta = metadata.get(_DC_NS, {})
+    has_title = bool(dc_meta.get("title"))
+    has_creator = bool(dc_meta.get("creator"))
+
+    return has_title and has_creator
+
+
+def _extract_metadata(metadata: dict) -> dict[str, Any]:
+    """Flatten ebooklib-shaped *metadata* into the dict returned by get_metadata."""
+    meta = {}
+
+    dc = metadata.get(_DC_NS, {})
+    logger.debug("meta: %r", dc)
+
+    for field in ("title", "publisher", "date", "language"):
+        val = _dc_scalar(dc, field)
+        if val:
+            meta[field] = val
+
+    if dc.get("subject"):
+        meta["tags"] = [s[0] if isinstance(s, tuple) else s for s in dc["subject"]]
+
+    if dc.get("creator"):
+        creators = [c[0] if isinstance(c, tuple) else c for c in dc["creator"]]
+        meta["author"] = creators[0] if len(creators) == 1 else creators
+
+    for identifier in dc.get("identifier", []):
+        id_value = identifier[0] if isinstance(identifier, tuple) else identifier
+        attrs = (
+            identifier[1]
+            if isinstance(identifier, tuple) and len(identifier) > 1
+            else {}
+        )
+        if isinstance(attrs, dict) and attrs.get("id") == "isbn":
+            # Stored as "isbn:<digits>" (see set_metadata); strip the scheme
+            # prefix so the logical ISBN round-trips cleanly through dump.
+            if isinstance(id_value, str) and id_value.lower().startswith("isbn:"):
+                id_value = id_value[len("isbn:") :]
+            meta["isbn"] = id_value
+            break
+
+    opf_meta = metadata.get(_OPF_NS, {})
+    logger.debug("opf meta: %r", opf_meta)
+
+    for item in opf_meta.get("meta", []):
+        if isinstance(item, tuple) and len(item) >= 2:
+            content = item[0]
+            attrs = item[1] if len(item) > 1 else {}
+            if isinstance(attrs, dict):
+                name = attrs.get("name", "")
+                if name == "calibre:series":
+                    meta["series"] = content
+                elif name == "calibre:series_index":
+                    try:
+                        meta["series_index"] = float(content)
+                    except (ValueError, TypeError):
+                        pass
+
+    return meta
+
+
 class EPUBMetadata:
     """Container for EPUB metadata."""
 
@@ -48,73 +129,11 @@ class EPUBMetadata:
 
     def has_metadata(self) -> bool:
         """Check if EPUB already has metadata set."""
-        meta = self.book.metadata.get("http://www.idpf.org/2007/opf", {})
-
-        for item in meta.get("meta", []):
-            if isinstance(item, tuple) and len(item) >= 2:
-                attrs = item[1] if len(item) > 1 else {}
-                if isinstance(attrs, dict):
-                    if attrs.get("name") == "calibre:series":
-                        return True
-
-        dc_meta = self.book.metadata.get("http://purl.org/dc/elements/1.1/", {})
-        has_title = bool(dc_meta.get("title"))
-        has_creator = bool(dc_meta.get("creator"))
-
-        return has_title and has_creator
+        return _has_metadata(self.book.metadata)
 
     def get_metadata(self) -> dict[str, Any]:
         """Extract current metadata from EPUB."""
-        meta = {}
-
-        dc = self.book.metadata.get("http://purl.org/dc/elements/1.1/", {})
-        logger.debug(f"meta: {dc}")
-
-        for field in ("title", "publisher", "date", "language"):
-            val = _dc_scalar(dc, field)
-            if val:
-                meta[field] = val
-
-        if dc.get("subject"):
-            meta["tags"] = [s[0] if isinstance(s, tuple) else s for s in dc["subject"]]
-
-        if dc.get("creator"):
-            creators = [c[0] if isinstance(c, tuple) else c for c in dc["creator"]]
-            meta["author"] = creators[0] if len(creators) == 1 else creators
-
-        for identifier in dc.get("identifier", []):
-            id_value = identifier[0] if isinstance(identifier, tuple) else identifier
-            attrs = (
-                identifier[1]
-                if isinstance(identifier, tuple) and len(identifier) > 1
-                else {}
-            )
-            if isinstance(attrs, dict) and attrs.get("id") == "isbn":
-                # Stored as "isbn:<digits>" (see set_metadata); strip the scheme
-                # prefix so the logical ISBN round-trips cleanly through dump.
-                if isinstance(id_value, str) and id_value.lower().startswith("isbn:"):
-                    id_value = id_value[len("isbn:") :]
-                meta["isbn"] = id_value
-                break
-
-        opf_meta = self.book.metadata.get("http://www.idpf.org/2007/opf", {})
-        logger.debug(f"opf meta: {opf_meta}")
-
-        for item in opf_meta.get("meta", []):
-            if isinstance(item, tuple) and len(item) >= 2:
-                content = item[0]
-                attrs = item[1] if len(item) > 1 else {}
-                if isinstance(attrs, dict):
-                    name = attrs.get("name", "")
-                    if name == "calibre:series":
-                        meta["series"] = content
-                    elif name == "calibre:series_index":
-                        try:
-                            meta["series_index"] = float(content)
-                        except (ValueError, TypeError):
-                            pass
-
-        return meta
+        return _extract_metadata(self.book.metadata)
 
     def set_metadata(
         self,
@@ -125,10 +144,14 @@ class EPUBMetadata:
         date: str | None = None,
         isbn: str | None = None,
         publisher: str | None = None,
-        language: str = "en-US",
+        language: str | None = None,
         tags: list[str] | None = None,
     ):
-        """Set metadata in EPUB file."""
+        """Set metadata in EPUB file.
+
+        Fields left as None are not touched. `language` replaces the existing
+        dc:language when given; an empty string clears it.
+        """
 
         if title:
             dc_ns = "http://purl.org/dc/elements/1.1/"
@@ -153,9 +176,12 @@ class EPUBMetadata:
         if date:
             self.book.add_metadata("DC", "date", date)
 
-        if language:
-            self.book.add_metadata("DC", "language", language)
-            self.book.set_language(language)
+        if language is not None:
+            # Replace rather than append: set_language() already records the
+            # DC entry, and a stale first entry would win on the next read.
+            self.book.metadata.setdefault(_DC_NS, {})["language"] = []
+            if language:
+                self.book.set_language(language)
 
         if isbn:
             clean_isbn = isbn.replace("-", "").replace(" ", "")
@@ -259,3 +285,49 @@ class EPUBMetadata:
         self._ensure_toc_uids()
         epub.write_epub(str(self.filepath), self.book)
         logger.info(f"Saved: {self.filepath.name}")
+
+
+class OPFOnlyMetadata:
+    """Read-only metadata view parsed from the EPUB's OPF package file only.
+
+    Exposes the same ``get_metadata()`` / ``has_metadata()`` API as
+    ``EPUBMetadata`` but only reads ``META-INF/container.xml`` and the OPF it
+    points to, never the spine, TOC or images. Use it for read-only paths such
+    as ``dump``; write paths still need ``EPUBMetadata``.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.metadata: dict[str, dict[str, list]] = {}
+        self._load()
+
+    def _load(self):
+        """Load the OPF ``<metadata>`` block into ebooklib's nested layout."""
+        try:
+            with zipfile.ZipFile(self.filepath) as zf:
+                container = ET.fromstring(zf.read("META-INF/container.xml"))
+                rootfile = container.find(f".//{{{_CONTAINER_NS}}}rootfile")
+                opf_path = rootfile.get("full-path") if rootfile is not None else None
+                if not opf_path:
+                    raise KeyError("no rootfile in META-INF/container.xml")
+                package = ET.fromstring(zf.read(opf_path))
+        except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+            raise ValueError(f"Failed to load EPUB {self.filepath}: {e}") from e
+
+        block = package.find(f"{{{_OPF_NS}}}metadata")
+        for el in block if block is not None else ():
+            if not isinstance(el.tag, str) or not el.tag.startswith("{"):
+                continue
+            ns, _, tag = el.tag[1:].partition("}")
+            values = self.metadata.setdefault(ns, {}).setdefault(tag, [])
+            # calibre writes `<meta name=... content=.../>` with no text.
+            text = el.text if el.text is not None else el.get("content")
+            values.append((text, dict(el.attrib)))
+
+    def has_metadata(self) -> bool:
+        """Check if EPUB already has metadata set."""
+        return _has_metadata(self.metadata)
+
+    def get_metadata(self) -> dict[str, Any]:
+        """Extract current metadata from the OPF."""
+        return _extract_metadata(self.metadata)
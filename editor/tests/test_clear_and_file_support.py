@@ -119,3 +119,33 @@ def test_inject_metadata_into_single_file(tmp_path: Path):
     meta = EPUBMetadata(book_file).get_metadata()
     assert meta.get("author") == "Injected Author"
     assert meta.get("series") == "Series"
+
+
+def test_clear_metadata_clears_language(tmp_path: Path):
+    """clear strips dc:language instead of re-adding the en-US default."""
+    book_file = tmp_path / "Series v01.epub"
+    _make_minimal_epub(book_file)
+    em = EPUBMetadata(book_file)
+    em.set_metadata(language="fr")
+    em.save()
+
+    assert clear_metadata(book_file, dry_run=False) == 0
+
+    assert EPUBMetadata(book_file).get_metadata().get("language") is None
+
+
+def test_set_metadata_replaces_language(tmp_path: Path):
+    """Re-setting the language replaces the old entry and writes it once."""
+    book_file = tmp_path / "Series v01.epub"
+    _make_minimal_epub(book_file)
+    em = EPUBMetadata(book_file)
+    em.set_metadata(language="fr")
+    em.save()
+
+    em = EPUBMetadata(book_file)
+    em.set_metadata(language="ja")
+    em.save()
+
+    em = EPUBMetadata(book_file)
+    assert em.get_metadata().get("language") == "ja"
+    assert len(em.book.metadata["http://purl.org/dc/elements/1.1/"]["language"]) == 1
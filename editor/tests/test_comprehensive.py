@@ -34,6 +34,7 @@ from editor.editor_full import (
     inject_metadata,
     load_yaml_metadata,
     parse_volume_number,
+    parse_volume_numbers,
 )
 
 # ---------------------------------------------------------------------------
@@ -93,6 +94,21 @@ class TestParseVolumeNumber:
     def test_single_digit(self):
         assert parse_volume_number("Series v1.epub") == 1
 
+    def test_batch_matches_single(self):
+        names = [
+            "Mashle v01.epub",
+            "Series vol.03.epub",
+            "Series Name 05.kepub.epub",
+            "NoNumberHere.epub",
+            "VOLUME 07.epub",
+            "Endsinv",
+            "12 starts with digits.epub",
+        ]
+        assert parse_volume_numbers(names) == [parse_volume_number(n) for n in names]
+
+    def test_batch_empty(self):
+        assert parse_volume_numbers([]) == []
+
 
 # ---------------------------------------------------------------------------
 # _get_epub_files – unit tests
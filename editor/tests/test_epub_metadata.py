@@ -5,7 +5,7 @@ import pytest
 pytest.importorskip("ebooklib")
 from ebooklib import epub
 
-from editor.editor_full import EPUBMetadata
+from editor.editor_full import EPUBMetadata, OPFOnlyMetadata
 
 
 def test_epubmetadata_reads_title_and_author(tmp_path: Path):
@@ -29,3 +29,30 @@ def test_epubmetadata_reads_title_and_author(tmp_path: Path):
     assert meta.get("title") == "My Title"
     assert meta.get("author") == "An Author"
     assert em.has_metadata()
+
+
+def test_opf_only_metadata_matches_epubmetadata(tmp_path: Path, make_epub):
+    out = make_epub(tmp_path / "Series v01.epub")
+    em = EPUBMetadata(out)
+    em.set_metadata(
+        title="Series v01",
+        author=["A", "B"],
+        series="Series",
+        series_index=1.0,
+        date="2021-09-16",
+        isbn="978-2-38071-528-6",
+        publisher="Shueisha",
+        tags=["Action"],
+    )
+    em.save()
+
+    opf = OPFOnlyMetadata(out)
+    assert opf.get_metadata() == EPUBMetadata(out).get_metadata()
+    assert opf.has_metadata()
+
+
+def test_opf_only_metadata_bad_file(tmp_path: Path):
+    bad = tmp_path / "bad.epub"
+    bad.write_bytes(b"not a zip file at all")
+    with pytest.raises(ValueError, match="Failed to load EPUB"):
+        OPFOnlyMetadata(bad)
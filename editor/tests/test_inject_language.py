@@ -82,3 +82,20 @@ def test_inject_language_per_volume_overrides_series(tmp_path: Path):
         ],
     }
     assert _inject_and_read(tmp_path, data) == "ja"
+
+
+def test_set_metadata_title_only_keeps_language(tmp_path: Path):
+    """A partial update without ``language`` leaves the existing one alone."""
+    book_file = tmp_path / "book.epub"
+    _make_minimal_epub(book_file)
+    meta = EPUBMetadata(book_file)
+    meta.set_metadata(language="fr")
+    meta.save()
+
+    meta = EPUBMetadata(book_file)
+    meta.set_metadata(title="New Title")
+    meta.save()
+
+    result = EPUBMetadata(book_file).get_metadata()
+    assert result.get("title") == "New Title"
+    assert result.get("language") == "fr"
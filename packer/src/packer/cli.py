@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
 import logging
 import os
 import re
@@ -16,12 +18,12 @@ import shtab
 from .config import Config
 from .core import (
     NAMED_PATTERNS,
-    find_cbz_files,
     parse_range,
+    scan_cbz_with_chapters,
 )
 from .exit_codes import CLI_ERROR, SUCCESS
 from .types_ import CoverMapping
-from .worker import process_volume
+from .worker import process_volume, wait_for_discards
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,49 @@ def add_version_arg(parser: argparse.ArgumentParser, dist_name: str) -> None:
     parser.add_argument("--version", action="version", version=f"%(prog)s {ver}")
 
 
+_RESET = "\x1b[0m"
+_LEVEL_COLORS = {
+    "DEBUG": "\x1b[34m",  # blue
+    "INFO": "\x1b[32m",  # green
+    "WARNING": "\x1b[33m",  # yellow
+    "ERROR": "\x1b[31m",  # red
+    "CRITICAL": "\x1b[31;1m",
+}
+_LEVEL_EMOJI = {
+    "DEBUG": "🔧",
+    "INFO": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+    "CRITICAL": "💥",
+}
+# Record prefixes per level, built once so format() does a single lookup.
+_PLAIN_PREFIXES = {lvl: f"{emoji} {lvl}:" for lvl, emoji in _LEVEL_EMOJI.items()}
+_COLOR_PREFIXES = {
+    lvl: f"{_LEVEL_COLORS[lvl]}{emoji} {lvl}:{_RESET}"
+    for lvl, emoji in _LEVEL_EMOJI.items()
+}
+
+
+class ColorFormatter(logging.Formatter):
+    """Compact ``<emoji> LEVEL: message`` formatter with optional ANSI colour."""
+
+    def __init__(self, use_color: bool = True):
+        super().__init__()
+        self.use_color = use_color
+        self._prefixes = _COLOR_PREFIXES if use_color else _PLAIN_PREFIXES
+
+    def format(self, record: logging.LogRecord) -> str:
+        level = record.levelname
+        prefix = self._prefixes.get(level)
+        if prefix is None:
+            # Custom level names carry no emoji or colour.
+            prefix = f" {level}:{_RESET}" if self.use_color else f" {level}:"
+        formatted = f"{prefix} {record.getMessage()}"
+        if record.exc_info:
+            formatted = f"{formatted}\n{self.formatException(record.exc_info)}"
+        return formatted
+
+
 def setup_logging(
     verbose: bool = False,
     loglevel: Optional[str] = None,
@@ -74,49 +119,16 @@ def setup_logging(
     else:
         use_color = hasattr(stream, "isatty") and stream.isatty()
 
-    class ColorFormatter(logging.Formatter):
-        COLORS = {
-            "DEBUG": "\x1b[34m",  # blue
-            "INFO": "\x1b[32m",  # green
-            "WARNING": "\x1b[33m",  # yellow
-            "ERROR": "\x1b[31m",  # red
-            "CRITICAL": "\x1b[31;1m",
-        }
-        EMOJI = {
-            "DEBUG": "🔧",
-            "INFO": "✅",
-            "WARNING": "⚠️",
-            "ERROR": "❌",
-            "CRITICAL": "💥",
-        }
-        RESET = "\x1b[0m"
-
-        def __init__(self, use_color: bool = True):
-            super().__init__()
-            self.use_color = use_color
-
-        def format(self, record: logging.LogRecord) -> str:
-            level = record.levelname
-            emoji = self.EMOJI.get(level, "")
-            if self.use_color:
-                color = self.COLORS.get(level, "")
-                prefix = f"{color}{emoji} {level}:{self.RESET}"
-            else:
-                prefix = f"{emoji} {level}:"
-            # Base message
-            msg = record.getMessage()
-            # Simple formatting: prefix + message
-            formatted = f"{prefix} {msg}"
-            # Handle exception formatting if present
-            if record.exc_info:
-                formatted = f"{formatted}\n{self.formatException(record.exc_info)}"
-            return formatted
-
     handler.setFormatter(ColorFormatter(use_color))
     root.setLevel(level)
     root.addHandler(handler)
 
 
+# `vNN:range` items of a --batch spec, and the volume column of a batch file.
+_VOL_SPEC_RE = re.compile(r"(?i)v\s*0*([0-9]+):(.+)")
+_VOL_ONLY_RE = re.compile(r"(?i)v?\s*0*([0-9]+)")
+
+
 def parse_batch_spec(batch: str) -> list[tuple[int, list[int]]]:
     """Parse a batch spec string into a list of (volume, chapter_range) tuples.
 
@@ -131,7 +143,7 @@ def parse_batch_spec(batch: str) -> list[tuple[int, list[int]]]:
     specs = [s for s in batch.split("-") if s.strip()]
     parsed = []
     for s in specs:
-        m = re.match(r"(?i)v\s*0*([0-9]+):(.+)", s.strip())
+        m = _VOL_SPEC_RE.match(s.strip())
         if not m:
             raise ValueError(f"invalid batch spec: {s}")
         vol_num = int(m.group(1))
@@ -153,22 +165,22 @@ def parse_batch_file(file_path: str) -> list[tuple[int, list[int]]]:
     Returns:
         List[Tuple[int, List[int]]]
     """
-    specs = []
     with open(file_path, "r", encoding="utf-8") as fh:
-        for ln in fh:
-            ln = ln.strip()
-            if not ln or ln.startswith("#"):
-                continue
-            parts = [p.strip() for p in ln.split(",") if p.strip()]
-            if len(parts) < 2:
-                raise ValueError(f"invalid batch file line: {ln}")
-            vol_spec, range_spec = parts[0], parts[1]
-            m = re.match(r"(?i)v?\s*0*([0-9]+)", vol_spec)
-            if not m:
-                raise ValueError(f"invalid volume spec in batch file: {vol_spec}")
-            vol_num = int(m.group(1))
-            ranges = parse_range(range_spec)
-            specs.append((vol_num, ranges))
+        lines = fh.read().splitlines()
+    rows = [ln for ln in map(str.strip, lines) if ln and not ln.startswith("#")]
+
+    specs = []
+    for ln in rows:
+        parts = [p.strip() for p in ln.split(",") if p.strip()]
+        if len(parts) < 2:
+            raise ValueError(f"invalid batch file line: {ln}")
+        vol_spec, range_spec = parts[0], parts[1]
+        m = _VOL_ONLY_RE.match(vol_spec)
+        if not m:
+            raise ValueError(f"invalid volume spec in batch file: {vol_spec}")
+        vol_num = int(m.group(1))
+        ranges = parse_range(range_spec)
+        specs.append((vol_num, ranges))
     return specs
 
 
@@ -232,6 +244,15 @@ def _resolve_config_path(value: str, base_dir: str) -> str:
     return os.path.normpath(os.path.join(base_dir, expanded))
 
 
+def _default_nb_worker() -> int:
+    """Default chapter worker count.
+
+    Chapter processing is dominated by file I/O and zlib, both of which release
+    the GIL, so threads are oversubscribed relative to the CPU count.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         description="Pack .cbz chapters into volume directories"
@@ -257,7 +278,10 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("--volume", type=int, help="volume number to create")
     p.add_argument("--chapter-range", help='chapter range, e.g. "1..12" or "1,3,5..8"')
     p.add_argument(
-        "--nb-worker", type=int, default=1, help="number of workers (default 1)"
+        "--nb-worker",
+        type=int,
+        default=None,
+        help="number of chapter workers (default: min(32, 4 x CPU count))",
     )
     p.add_argument("--dry-run", action="store_true", help="simulate actions")
     p.add_argument("--verbose", action="store_true", help="verbose logging")
@@ -335,7 +359,7 @@ def _apply_path_config(args: argparse.Namespace) -> list[CoverMapping] | None:
             args.chapter_regex = path_config["chapter_regex"]
         if args.extra_regex is None and "extra_regex" in path_config:
             args.extra_regex = path_config["extra_regex"]
-        if args.nb_worker == 1 and "nb_worker" in path_config:
+        if args.nb_worker is None and "nb_worker" in path_config:
             args.nb_worker = int(path_config["nb_worker"])
         _batch_file_val = path_config.get("batch_file") or path_config.get("batch")
         if args.batch_file is None and _batch_file_val:
@@ -445,7 +469,9 @@ def _resolve_batch_specs(
 
 def _run_batch(batch_specs: list[tuple[int, list[int]]], cfg: Config) -> int:
     """Execute all batch volumes and return the exit code."""
-    cbz_files = find_cbz_files(cfg.path)
+    # Parse every filename once; batch volumes then look their chapters up.
+    matches = dict(scan_cbz_with_chapters(cfg.path, cfg.chapter_pat, cfg.extra_pat))
+    cbz_files = list(matches)
     total_volumes = len(batch_specs)
     total_chapters = sum(len(ranges) for _, ranges in batch_specs)
     start_time = time.monotonic()
@@ -455,12 +481,26 @@ def _run_batch(batch_specs: list[tuple[int, list[int]]], cfg: Config) -> int:
     )
 
     available_files = cbz_files.copy()
-    for vol_num, ranges in batch_specs:
-        cfg.volume = vol_num
-        cfg.chapter_range = ranges
-        rc, available_files = process_volume(vol_num, ranges, available_files, cfg)
-        if rc != 0:
-            return rc
+    # One chapter pool for the whole run rather than one per volume.
+    pool = (
+        concurrent.futures.ThreadPoolExecutor(max_workers=cfg.nb_worker)
+        if cfg.nb_worker > 1
+        else contextlib.nullcontext()
+    )
+    try:
+        with pool as executor:
+            for vol_num, ranges in batch_specs:
+                cfg.volume = vol_num
+                cfg.chapter_range = ranges
+                rc, available_files = process_volume(
+                    vol_num, ranges, available_files, cfg, matches, executor
+                )
+                if rc != 0:
+                    return rc
+    finally:
+        # --force deletes old chapter dirs in the background; finish them
+        # before reporting, on success and failure alike.
+        wait_for_discards()
 
     elapsed = time.monotonic() - start_time
     logger.info(
@@ -485,7 +525,9 @@ def main(argv=None) -> int:
             serie=args.serie,
             volume=args.volume if args.volume else 0,
             chapter_range=parse_range(args.chapter_range) if args.chapter_range else [],
-            nb_worker=args.nb_worker,
+            nb_worker=(
+                args.nb_worker if args.nb_worker is not None else _default_nb_worker()
+            ),
             dry_run=args.dry_run,
             verbose=args.verbose,
             force=args.force,
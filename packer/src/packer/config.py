@@ -27,9 +27,3 @@ class Config:
     chapter_pat: Optional[re.Pattern] = None
     extra_pat: Optional[re.Pattern] = None
     covers: Optional[List[CoverMapping]] = None
-
-    # convenience helper for worker module
-    def has_comicinfo(self, path: str) -> bool:
-        from .core import has_comicinfo
-
-        return has_comicinfo(path)
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
 import xml.etree.ElementTree as ET
 import zipfile
-from pathlib import PurePosixPath
-from typing import Dict, List, Optional, Set, Tuple
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .types_ import ChapterMapping, ChapterMatch
 
 logger = logging.getLogger(__name__)
 
-CHAPTER_PATTERNS = [
-    re.compile(r"(?i)chapter[\s._-]*0*([0-9]+)"),
-    re.compile(r"(?i)ch(?:\.|apter)?[\s._-]*0*([0-9]+)"),
-]
+# Fallback pattern used by extract_chapter_match when no custom pattern
+# matches. "ch", "ch." and "chapter" prefixes share one alternation, so each
+# filename is scanned once.
+_CHAPTER_RE = re.compile(r"(?i)ch(?:\.|apter)?[\s._-]*0*([0-9]+)(?:\.([0-9]+))?")
+# Same pattern for newline-joined basenames: separators may not cross a newline
+# into the next name.
+_CHAPTER_LINE_RE = re.compile(
+    r"(?i)ch(?:\.|apter)?(?:[^\S\n]|[._-])*0*([0-9]+)(?:\.([0-9]+))?"
+)
+
+
+# One comma-separated part of a chapter range: `N` or `N..M`.
+_RANGE_PART_RE = re.compile(r"\s*([0-9]+)(?:\s*\.\.\s*([0-9]+))?\s*")
 
 
 def parse_range(text: str) -> List[int]:
@@ -33,19 +44,36 @@ def parse_range(text: str) -> List[int]:
 
     Raises ValueError when an end is smaller than the start.
     """
-    parts = [p.strip() for p in text.split(",") if p.strip()]
+    # Batch specs often repeat the same range for every volume; the parse is
+    # cached and each caller gets its own list.
+    return list(_parse_range_cached(text))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_range_cached(text: str) -> Tuple[int, ...]:
+    """Parse *text* for parse_range; returns an immutable, cacheable tuple."""
+    spans = [_parse_range_part(p) for p in text.split(",") if p.strip()]
+    if len(spans) == 1:
+        # A single number or inclusive range is already sorted and unique.
+        return tuple(spans[0])
     nums: Set[int] = set()
-    for p in parts:
-        if ".." in p:
-            a, b = p.split("..", 1)
-            a_i = int(a)
-            b_i = int(b)
-            if b_i < a_i:
-                raise ValueError(f"Invalid range {p}: end < start")
-            nums.update(range(a_i, b_i + 1))
-        else:
-            nums.add(int(p))
-    return sorted(nums)
+    for span in spans:
+        nums.update(span)
+    return tuple(sorted(nums))
+
+
+def _parse_range_part(part: str) -> range:
+    """Return the inclusive range for an `N` or `N..M` part."""
+    m = _RANGE_PART_RE.fullmatch(part)
+    if m is None:
+        raise ValueError(f"Invalid range {part.strip()}")
+    start = int(m.group(1))
+    if m.group(2) is None:
+        return range(start, start + 1)
+    end = int(m.group(2))
+    if end < start:
+        raise ValueError(f"Invalid range {part.strip()}: end < start")
+    return range(start, end + 1)
 
 
 def _match_extra(base: str, extra_pat: Optional[re.Pattern]) -> Optional[ChapterMatch]:
@@ -78,57 +106,46 @@ def _match_chapter(base: str, chapter_pat: Optional[re.Pattern]) -> Optional[int
         return None
 
 
-def extract_chapter_number(
+def extract_chapter_match(
     filename: str,
     chapter_pat: Optional[re.Pattern] = None,
     extra_pat: Optional[re.Pattern] = None,
-) -> List[ChapterMatch]:
-    """Extract chapter numbers and optional extra suffixes from a filename.
+) -> Optional[ChapterMatch]:
+    """Return the chapter match for a filename, or None when nothing matches.
 
     Behaviour summary:
     - If `extra_pat` is provided and matches, the file is treated as an extra.
     - Otherwise, if `chapter_pat` matches, a main chapter is returned.
-    - If neither pattern matches, a set of legacy patterns is used as fallback.
-
-    Returns a list of ChapterMatch NamedTuples where extra is None for main chapters.
-    """  # noqa: E501
+    - If neither pattern matches, the legacy pattern is used as fallback.
+    """
     base = os.path.basename(filename)
-    results: Set[ChapterMatch] = set()
 
-    # Extra pattern takes precedence when provided: treat as an extra and return it
+    # Extra pattern takes precedence when provided: treat as an extra
     extra_match = _match_extra(base, extra_pat)
     if extra_match is not None:
-        results.add(extra_match)
-        return sorted(
-            results, key=lambda x: (x.base, x.extra if x.extra is not None else "")
-        )
+        return extra_match
 
     # Then try chapter/main pattern
     chapter_match = _match_chapter(base, chapter_pat)
     if chapter_match is not None:
-        results.add(ChapterMatch(base=chapter_match, extra=None))
+        return ChapterMatch(base=chapter_match, extra=None)
 
-    # Fall back to legacy patterns if none found
-    if not results:
-        legacy_patterns = [
-            re.compile(r"(?i)chapter[\s._-]*0*([0-9]+)(?:\.([0-9]+))?"),
-            re.compile(r"(?i)ch(?:\.|apter)?[\s._-]*0*([0-9]+)(?:\.([0-9]+))?"),
-        ]
-        for pat in legacy_patterns:
-            m = pat.search(base)
-            if m:
-                try:
-                    base_num = int(m.group(1))
-                    extra = m.group(2)
-                    results.add(ChapterMatch(base=base_num, extra=extra))
-                except Exception:
-                    continue
-
-    # Sort by base then by extra (treat None as empty string for sorting)
-    return sorted(
-        results,
-        key=lambda x: (x.base, x.extra if x.extra is not None else ""),  # noqa: E501
-    )
+    # Fall back to the legacy pattern
+    return _legacy_match(base)
+
+
+def extract_chapter_number(
+    filename: str,
+    chapter_pat: Optional[re.Pattern] = None,
+    extra_pat: Optional[re.Pattern] = None,
+) -> List[ChapterMatch]:
+    """Extract chapter numbers and optional extra suffixes from a filename.
+
+    List form of :func:`extract_chapter_match`: empty when nothing matches,
+    otherwise a single ChapterMatch where extra is None for main chapters.
+    """
+    match = extract_chapter_match(filename, chapter_pat, extra_pat)
+    return [match] if match is not None else []
 
 
 def find_cbz_files(root: str) -> List[str]:
@@ -145,19 +162,104 @@ def find_cbz_files(root: str) -> List[str]:
         OSError: If scanning the directory fails (propagates the underlying
         filesystem exception to the caller).
     """
-    files: List[str] = []
-    for entry in os.listdir(root):
-        if entry.lower().endswith(".cbz") and os.path.isfile(os.path.join(root, entry)):
-            files.append(os.path.join(root, entry))
-    return files
+    # scandir's DirEntry carries the file type from readdir, so is_file() needs
+    # no extra stat() per entry (unlike listdir + os.path.isfile). Only the
+    # 4-character suffix is lower-cased.
+    with os.scandir(root) as it:
+        return [
+            entry.path
+            for entry in it
+            if entry.name[-4:].lower() == ".cbz" and entry.is_file()
+        ]
+
+
+def scan_cbz_with_chapters(
+    root: str,
+    chapter_pat: Optional[re.Pattern] = None,
+    extra_pat: Optional[re.Pattern] = None,
+) -> Iterator[Tuple[str, Optional[ChapterMatch]]]:
+    """Yield `(path, chapter_match)` for each `.cbz` file found in `root`.
+
+    The directory is listed in full with find_cbz_files first, then every
+    name is parsed: in one batch by _legacy_chapter_matches when no custom
+    pattern is given, otherwise one by one with extract_chapter_match. Only
+    then are the pairs yielded, so nothing is streamed; the function just
+    gives callers the paths and their matches from one call. The match is
+    None for unrecognised names.
+
+    Raises:
+        OSError: If scanning the directory fails.
+    """
+    paths = find_cbz_files(root)
+    if chapter_pat is None and extra_pat is None:
+        matches = _legacy_chapter_matches(paths)
+    else:
+        matches = [extract_chapter_match(p, chapter_pat, extra_pat) for p in paths]
+    yield from zip(paths, matches)
+
+
+def _legacy_chapter_matches(cbz_files: List[str]) -> List[Optional[ChapterMatch]]:
+    """Return the fallback-pattern match of each file's basename, or None.
+
+    Equivalent to calling extract_chapter_number without custom patterns on
+    each file, but the regex runs once over the newline-joined basenames.
+    """
+    names = [os.path.basename(p) for p in cbz_files]
+    if any("\n" in name for name in names):
+        return [_legacy_match(name) for name in names]
+
+    joined = "\n".join(names)
+    starts = list(accumulate((len(n) + 1 for n in names[:-1]), initial=0))
+    results: List[Optional[ChapterMatch]] = [None] * len(names)
+    for m in _CHAPTER_LINE_RE.finditer(joined):
+        idx = bisect_right(starts, m.start()) - 1
+        if results[idx] is None:
+            results[idx] = ChapterMatch(base=int(m.group(1)), extra=m.group(2))
+    return results
+
+
+def _legacy_match(base: str) -> Optional[ChapterMatch]:
+    """Return the fallback-pattern match for a single basename, or None."""
+    m = _CHAPTER_RE.search(base)
+    if m is None:
+        return None
+    return ChapterMatch(base=int(m.group(1)), extra=m.group(2))
+
+
+def group_chapter_matches(
+    pairs: Iterable[Tuple[str, Optional[ChapterMatch]]],
+    wanted: Optional[Set[int]] = None,
+) -> ChapterMapping:
+    """Group `(path, match)` pairs into {base: {'mains': [...], 'extras': [...]}}.
+
+    Unmatched paths are skipped; when `wanted` is given, so are chapters
+    outside it.
+    """
+    mapping: Dict[int, Dict[str, List[Tuple[Optional[str], str]]]] = {}
+    for p, m in pairs:
+        if m is None:
+            continue
+        if wanted is not None and m.base not in wanted:
+            continue
+        entry = mapping.setdefault(m.base, {"mains": [], "extras": []})
+        if m.extra is None:
+            entry["mains"].append((None, p))
+        else:
+            entry["extras"].append((m.extra, p))
+    return mapping
 
 
 def map_chapters_to_files(
     cbz_files: List[str],
+    wanted: Optional[Set[int]] = None,
+    chapter_pat: Optional[re.Pattern] = None,
+    extra_pat: Optional[re.Pattern] = None,
 ) -> ChapterMapping:
     """Map chapter numbers to their matching archives.
 
-    Returns a mapping {base: {'mains': [...], 'extras': [...]}}.
+    Returns a mapping {base: {'mains': [...], 'extras': [...]}}. When `wanted`
+    is given, only those chapter numbers are recorded. `chapter_pat` and
+    `extra_pat` are passed to extract_chapter_match.
 
     Example:
     >>> m = map_chapters_to_files(['Chapter 1.cbz', 'Chapter 1.5.cbz'])
@@ -168,25 +270,20 @@ def map_chapters_to_files(
     >>> m[1]['extras'][0][0]
     '5'
     """
-    mapping: Dict[int, Dict[str, List[Tuple[Optional[str], str]]]] = {}
-    for p in cbz_files:
-        matches = extract_chapter_number(p)
-        for m in matches:
-            base_num = m.base
-            extra = m.extra
-            entry = mapping.setdefault(base_num, {"mains": [], "extras": []})
-            if extra is None:
-                entry["mains"].append((None, p))
-            else:
-                entry["extras"].append((extra, p))
-    return mapping
+    if chapter_pat is None and extra_pat is None:
+        matches = _legacy_chapter_matches(cbz_files)
+    else:
+        matches = [extract_chapter_match(p, chapter_pat, extra_pat) for p in cbz_files]
+    return group_chapter_matches(zip(cbz_files, matches), wanted)
 
 
-def has_comicinfo(cbz_path: str) -> bool:
+def has_comicinfo(cbz: str | zipfile.ZipFile) -> bool:
     """Check whether a `.cbz` archive contains a valid `ComicInfo.xml` file.
 
     Args:
-        cbz_path: Path to the `.cbz` file to inspect.
+        cbz: Path to the `.cbz` file to inspect, or an already-open
+            `zipfile.ZipFile` (lets callers that go on to extract the archive
+            reuse one handle instead of parsing the central directory twice).
 
     Returns:
         True if an entry whose basename is (case-insensitive) exactly
@@ -206,30 +303,42 @@ def has_comicinfo(cbz_path: str) -> bool:
           fine for local trusted archives. If untrusted input ever becomes a
           concern, `defusedxml` would be the hardened choice instead.
     """
+    if isinstance(cbz, zipfile.ZipFile):
+        return _check_comicinfo(cbz, str(cbz.filename))
     try:
-        with zipfile.ZipFile(cbz_path, "r") as z:
-            names = z.namelist()
-            matches = [
-                n for n in names if PurePosixPath(n).name.lower() == "comicinfo.xml"
-            ]
-            if not matches:
-                return False
-            if len(matches) > 1:
-                logger.warning(
-                    "multiple ComicInfo.xml entries in %s; using first", cbz_path
-                )
-            entry = matches[0]
-            data = z.read(entry)
-            try:
-                ET.fromstring(data)
-            except ET.ParseError as e:
-                logger.warning("malformed ComicInfo.xml in %s: %s", cbz_path, e)
-                return False
-            return True
+        with zipfile.ZipFile(cbz, "r") as z:
+            return _check_comicinfo(z, str(cbz))
     except (zipfile.BadZipFile, OSError):
         return False
 
 
+def _check_comicinfo(z: zipfile.ZipFile, label: str) -> bool:
+    """Validate the `ComicInfo.xml` entry of an open archive (see has_comicinfo)."""
+    # Walk the already-parsed ZipInfo list. Most entries are rejected on a
+    # lower-cased 13-character tail; only candidates pay for the rpartition
+    # that checks the basename is exactly ComicInfo.xml.
+    matches = [
+        info
+        for info in z.filelist
+        if info.filename[-13:].lower() == "comicinfo.xml"
+        and info.filename.rpartition("/")[2].lower() == "comicinfo.xml"
+    ]
+    if not matches:
+        return False
+    if len(matches) > 1:
+        logger.warning("multiple ComicInfo.xml entries in %s; using first", label)
+    try:
+        data = z.read(matches[0])
+    except (zipfile.BadZipFile, OSError):
+        return False
+    try:
+        ET.fromstring(data)
+    except ET.ParseError as e:
+        logger.warning("malformed ComicInfo.xml in %s: %s", label, e)
+        return False
+    return True
+
+
 def format_volume_dir(dest: str, serie: str, volume: int) -> str:
     """Return the canonical volume directory path.
 
@@ -3,24 +3,64 @@
 These convenience functions are intended for use by the test suite only.
 """
 
+import contextlib
+import functools
+import io
+import os
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 
+# Set to a non-empty value to run the CLI in a child interpreter instead of
+# in-process (true end-to-end runs, at the cost of interpreter start-up).
+SUBPROCESS_ENV = "PACKER_TEST_SUBPROCESS"
+
 
 def run_packer(tmp_path: Path, args):
-    script = Path(__file__).resolve().parent / "main.py"
-    cmd = [sys.executable, str(script)] + args
-    res = subprocess.run(cmd, capture_output=True, text=True)
-    return res
+    """Run the packer CLI with `args` and return a CompletedProcess.
 
+    By default `main()` is called in-process with stdout/stderr captured;
+    see SUBPROCESS_ENV for the subprocess path.
+    """
+    if os.environ.get(SUBPROCESS_ENV):
+        script = Path(__file__).resolve().parent / "main.py"
+        cmd = [sys.executable, str(script)] + args
+        return subprocess.run(cmd, capture_output=True, text=True)
 
-def make_cbz(path: Path, name: str, include_comicinfo: bool = True):
-    import zipfile
+    from packer.cli import main
 
-    p = path / name
-    with zipfile.ZipFile(p, "w") as z:
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = main(list(args))
+        except SystemExit as e:  # argparse --help/--version and usage errors
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return subprocess.CompletedProcess(
+        ["packer", *args], rc, out.getvalue(), err.getvalue()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def make_cbz_bytes(include_comicinfo: bool = True) -> bytes:
+    """Return the raw bytes of a minimal .cbz archive built in memory.
+
+    Members carry a fixed timestamp, so the content only depends on
+    `include_comicinfo`; each variant is built once and shared.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as z:
         if include_comicinfo:
-            z.writestr("ComicInfo.xml", "<ComicInfo></ComicInfo>")
-        z.writestr("001.jpg", "img")
+            z.writestr(_member("ComicInfo.xml"), "<ComicInfo></ComicInfo>")
+        z.writestr(_member("001.jpg"), "img")
+    return buf.getvalue()
+
+
+def _member(name: str) -> zipfile.ZipInfo:
+    return zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+
+
+def make_cbz(path: Path, name: str, include_comicinfo: bool = True):
+    p = path / name
+    p.write_bytes(make_cbz_bytes(include_comicinfo))
     return p
@@ -3,92 +3,265 @@
 from __future__ import annotations
 
 import concurrent.futures
+import contextlib
+import errno
 import logging
+import os
+import re
 import shutil
+import tempfile
+import threading
 import zipfile
 from pathlib import Path
-from typing import List, Optional
-
-from .core import extract_chapter_number, format_chapter_dir, format_volume_dir
+from typing import Dict, List, Optional
+
+from .core import (
+    extract_chapter_match,
+    format_chapter_dir,
+    format_volume_dir,
+    group_chapter_matches,
+    has_comicinfo,
+    map_chapters_to_files,
+)
 from .exit_codes import DUPLICATE_CHAPTER, MISSING_CHAPTER, PROCESSING_ERROR, SUCCESS
-from .types_ import ChapterToFilesMapping, ProcessResult, ProcessVolumeResult, Task
+from .types_ import (
+    ChapterMatch,
+    ChapterToFilesMapping,
+    ProcessResult,
+    ProcessVolumeResult,
+    Task,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def _safe_extract(zf: zipfile.ZipFile, dest: Path) -> None:
-    """Extract *zf* into *dest*, raising ValueError on path-traversal attempts."""
-    resolved_dest = str(dest.resolve())
+# Copy buffer for member extraction. zipfile's extract() copies with the
+# 64 KiB shutil default; 1 MiB writes a typical page image in a single call.
+_COPY_BUFSIZE = 1 << 20
+
+# Member names that would land outside the extraction dir: absolute paths or
+# any ".." component. A string check avoids a resolve() syscall per member.
+_UNSAFE_MEMBER_RE = re.compile(r"^[/\\]|(?:^|[/\\])\.\.(?:[/\\]|$)")
+
+# Upper bound on per-archive extraction threads when chapters run serially.
+_MAX_MEMBER_WORKERS = 8
+
+# Background deletes started by _discard_dir, joined by wait_for_discards.
+_DISCARD_THREADS: List[threading.Thread] = []
+_DISCARD_LOCK = threading.Lock()
+
+
+def _extract_member(
+    zf: zipfile.ZipFile, member: zipfile.ZipInfo, target: Path, lock: threading.Lock
+) -> None:
+    """Copy one archive member to *target*.
+
+    ZipFile keeps an unlocked reference count of open members, so opening and
+    closing go through *lock*; the reads themselves are serialised by zipfile
+    and decompression runs without the GIL.
+    """
+    with lock:
+        src = zf.open(member)
+    try:
+        with open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+    finally:
+        with lock:
+            src.close()
+
+
+def _safe_extract(zf: zipfile.ZipFile, dest: Path, max_workers: int = 1) -> None:
+    """Extract *zf* into *dest*, raising ValueError on path-traversal attempts.
+
+    With *max_workers* > 1, file members are decompressed concurrently.
+    """
     for member in zf.infolist():
-        resolved = str((dest / member.filename).resolve())
-        if not (resolved == resolved_dest or resolved.startswith(resolved_dest + "/")):
+        if _UNSAFE_MEMBER_RE.search(member.filename):
             raise ValueError(f"Path traversal detected: {member.filename}")
-    zf.extractall(dest)
 
-
-def _ensure_dir(path: Path, dry_run: bool) -> None:
-    """Create directory if it doesn't exist."""
-    if not path.exists():
-        logger.debug(f"[worker] creating dir: {path}")
-        if not dry_run:
-            path.mkdir(parents=True, exist_ok=True)
-        else:
-            logger.debug(f"[dry-run] mkdir {path}")
+    made_dirs: set[Path] = set()
+    files: list[tuple[zipfile.ZipInfo, Path]] = []
+    for member in zf.infolist():
+        target = dest / member.filename
+        if member.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(target)
+            continue
+        if target.parent not in made_dirs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(target.parent)
+        files.append((member, target))
+
+    lock = threading.Lock()
+    if max_workers > 1 and len(files) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = [
+                ex.submit(_extract_member, zf, member, target, lock)
+                for member, target in files
+            ]
+            for fut in futures:
+                fut.result()
     else:
-        logger.debug(f"[worker] dir exists: {path}")
+        for member, target in files:
+            _extract_member(zf, member, target, lock)
 
 
-def process_one(chapter_id: str, src_file: str, cfg) -> ProcessResult:
-    """Process a single chapter archive: validate, move and extract it."""
-    logger.debug(f"[worker] start chapter={chapter_id} file={src_file}")
+def _ensure_dir(path: Path, dry_run: bool) -> None:
+    """Create directory if it doesn't exist."""
+    if dry_run:
+        logger.debug("[dry-run] mkdir %s", path)
+        return
+    # Chapter dirs reach here only when missing, where mkdir(exist_ok=True)
+    # is a single syscall and an exists() pre-check would add a stat(). An
+    # existing dir (the volume dir on a re-run) costs two: the failed mkdir
+    # plus an is_dir() check, one more than the pre-check, once per volume.
+    logger.debug("[worker] ensuring dir: %s", path)
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _discard_dir(path: Path, graveyard_root: Path) -> Optional[threading.Thread]:
+    """Move *path* out of the way and delete it in the background.
+
+    The rename into a fresh hidden `.packer-discard-*` directory under
+    *graveyard_root* is a single syscall, so the caller can recreate *path*
+    immediately; the recursive delete overlaps with the extraction. The
+    thread is recorded for wait_for_discards and also returned. When the
+    rename is not possible *path* is deleted synchronously and None is
+    returned.
+    """
+    try:
+        graveyard = Path(
+            tempfile.mkdtemp(prefix=f".packer-discard-{path.name}-", dir=graveyard_root)
+        )
+    except OSError as exc:
+        logger.debug("[worker] no graveyard (%s), deleting %s inline", exc, path)
+        shutil.rmtree(path)
+        return None
+    try:
+        os.replace(path, graveyard / path.name)
+    except OSError as exc:
+        logger.debug("[worker] cannot move %s aside (%s), deleting inline", path, exc)
+        graveyard.rmdir()
+        shutil.rmtree(path)
+        return None
+    thread = threading.Thread(
+        target=shutil.rmtree, args=(graveyard,), kwargs={"ignore_errors": True}
+    )
+    with _DISCARD_LOCK:
+        _DISCARD_THREADS.append(thread)
+    thread.start()
+    return thread
+
+
+def wait_for_discards() -> None:
+    """Wait for the background deletes started by _discard_dir."""
+    with _DISCARD_LOCK:
+        threads = _DISCARD_THREADS[:]
+        _DISCARD_THREADS.clear()
+    for thread in threads:
+        thread.join()
+
+
+def _move_archive(src: Path, dest: Path) -> None:
+    """Move *src* to *dest*: a single rename, or a copy across filesystems.
+
+    Across filesystems the copy goes to a ``.part`` sibling first and is
+    renamed into place, so *dest* never exists half-written.
+    """
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        tmp = dest.with_name(dest.name + ".part")
+        try:
+            shutil.copy2(src, tmp)
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        src.unlink()
+
+
+def process_one(
+    chapter_id: str,
+    src_file: str,
+    cfg,
+    volume_dir: Optional[Path] = None,
+    validated: bool = False,
+    member_workers: int = 1,
+) -> ProcessResult:
+    """Process a single chapter archive: validate, move and extract it.
+
+    The archive is opened once: the same handle validates ComicInfo.xml and
+    feeds the extraction. It stays readable across the move because an open
+    file descriptor follows the inode, not the path.
+
+    `volume_dir` is passed by process_volume, which has already created it;
+    when omitted it is derived from `cfg` and created here. `validated` is
+    set by process_volume once its preflight has checked ComicInfo.xml, so
+    the check is not repeated. `member_workers` is the number of threads
+    extracting the archive's members (see _safe_extract).
+    """
+    logger.debug("[worker] start chapter=%s file=%s", chapter_id, src_file)
 
     src_path = Path(src_file)
 
-    logger.debug(f"[worker] verifying ComicInfo.xml in {src_path}")
-    if not cfg.has_comicinfo(str(src_path)):
-        raise RuntimeError(f"Missing ComicInfo.xml in {src_path}")
+    try:
+        zf = zipfile.ZipFile(str(src_path), "r")
+    except (zipfile.BadZipFile, OSError):
+        raise RuntimeError(f"Bad zip file: {src_path}")
 
-    volume_dir = Path(format_volume_dir(cfg.dest, cfg.serie, cfg.volume))
-    _ensure_dir(volume_dir, cfg.dry_run)
+    with zf:
+        if not validated:
+            logger.debug("[worker] verifying ComicInfo.xml in %s", src_path)
+            if not has_comicinfo(zf):
+                raise RuntimeError(f"Missing ComicInfo.xml in {src_path}")
 
-    dest_archive = volume_dir / src_path.name
-    if cfg.dry_run:
-        logger.debug(f"[dry-run] mv {src_path} -> {dest_archive}")
-    else:
-        logger.debug(f"[worker] moving archive to {dest_archive}")
-        shutil.move(str(src_path), str(dest_archive))
+        if volume_dir is None:
+            volume_dir = Path(format_volume_dir(cfg.dest, cfg.serie, cfg.volume))
+            _ensure_dir(volume_dir, cfg.dry_run)
 
-    if "." in chapter_id:
-        base_part, extra_part = chapter_id.split(".", 1)
-        chapter_dir_name = format_chapter_dir(base_part, extra_part)
-    else:
-        chapter_dir_name = format_chapter_dir(chapter_id, None)
-    chapter_dir = volume_dir / chapter_dir_name
+        dest_archive = volume_dir / src_path.name
+        if cfg.dry_run:
+            logger.debug("[dry-run] mv %s -> %s", src_path, dest_archive)
+        else:
+            logger.debug("[worker] moving archive to %s", dest_archive)
+            _move_archive(src_path, dest_archive)
 
-    if chapter_dir.exists():
-        if cfg.force:
-            logger.debug(f"[worker] force-remove existing chapter dir: {chapter_dir}")
-            shutil.rmtree(str(chapter_dir))
-            _ensure_dir(chapter_dir, cfg.dry_run)
+        if "." in chapter_id:
+            base_part, extra_part = chapter_id.split(".", 1)
+            chapter_dir_name = format_chapter_dir(base_part, extra_part)
         else:
-            logger.warning(f"chapter dir exists, skipping: {chapter_dir}")
-            return ProcessResult(chapter_id, str(dest_archive))
-    else:
-        _ensure_dir(chapter_dir, cfg.dry_run)
+            chapter_dir_name = format_chapter_dir(chapter_id, None)
+        chapter_dir = volume_dir / chapter_dir_name
 
-    # In dry-run, inspect the original src file — dest_archive doesn't exist yet.
-    try:
-        archive_for_inspection = src_path if cfg.dry_run else dest_archive
-        with zipfile.ZipFile(str(archive_for_inspection), "r") as z:
-            if cfg.dry_run:
+        if chapter_dir.exists():
+            if cfg.force:
                 logger.debug(
-                    f"[dry-run] extract {archive_for_inspection} -> {chapter_dir}"
+                    "[worker] force-remove existing chapter dir: %s", chapter_dir
                 )
+                if cfg.dry_run:
+                    logger.debug("[dry-run] rm -r %s", chapter_dir)
+                else:
+                    # A dot-dir directly under dest: same filesystem as the
+                    # chapter, and skipped by convertor's volume scan.
+                    _discard_dir(chapter_dir, Path(cfg.dest))
+                _ensure_dir(chapter_dir, cfg.dry_run)
             else:
-                _safe_extract(z, chapter_dir)
-                logger.debug(f"[worker] extracted {dest_archive} -> {chapter_dir}")
-    except zipfile.BadZipFile:
-        raise RuntimeError(f"Bad zip file: {archive_for_inspection}")
+                logger.warning("chapter dir exists, skipping: %s", chapter_dir)
+                return ProcessResult(chapter_id, str(dest_archive))
+        else:
+            _ensure_dir(chapter_dir, cfg.dry_run)
+
+        if cfg.dry_run:
+            logger.debug("[dry-run] extract %s -> %s", src_path, chapter_dir)
+        else:
+            try:
+                _safe_extract(zf, chapter_dir, member_workers)
+            except zipfile.BadZipFile:
+                raise RuntimeError(f"Bad zip file: {dest_archive}")
+            logger.debug("[worker] extracted %s -> %s", dest_archive, chapter_dir)
 
     return ProcessResult(chapter_id, str(dest_archive))
 
@@ -97,7 +270,9 @@ def _plan_tasks(mapping: ChapterToFilesMapping, chapter_range: List[int]) -> Lis
     """Build ordered task list from the chapter mapping."""
     tasks: List[Task] = []
     for c in chapter_range:
-        entry = mapping.get(c, {"mains": [], "extras": []})
+        entry = mapping.get(c)
+        if not entry:
+            continue
         if entry.get("mains"):
             _, main_file = entry["mains"][0]
             tasks.append(Task(str(c), main_file))
@@ -110,6 +285,28 @@ def _plan_tasks(mapping: ChapterToFilesMapping, chapter_range: List[int]) -> Lis
     return tasks
 
 
+def _find_invalid_archives(
+    paths: List[str], executor: Optional[concurrent.futures.Executor] = None
+) -> List[str]:
+    """Return the archives in *paths* lacking a valid ComicInfo.xml.
+
+    Runs before anything is moved so a bad chapter cannot leave the volume
+    half-packed; the archives are probed concurrently, on `executor` when
+    given.
+    """
+    if len(paths) <= 1:
+        return [p for p in paths if not has_comicinfo(p)]
+    pool = (
+        contextlib.nullcontext(executor)
+        if executor is not None
+        else concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(16, 2 * (os.cpu_count() or 1), len(paths))
+        )
+    )
+    with pool as ex:
+        return [p for p, ok in zip(paths, ex.map(has_comicinfo, paths)) if not ok]
+
+
 def _copy_cover(volume_dir: Path, volume: int, cfg) -> None:
     """Copy the configured cover image into the volume directory."""
     if not cfg.covers:
@@ -119,35 +316,59 @@ def _copy_cover(volume_dir: Path, volume: int, cfg) -> None:
             continue
         src = Path(cm.cover_path)
         if not src.exists():
-            logger.warning(f"cover not found, skipping: {src}")
+            logger.warning("cover not found, skipping: %s", src)
             break
         cover_dest = volume_dir / "cover.webp"
         if cfg.dry_run:
-            logger.info(f"[DRY RUN] would copy cover {src} → {cover_dest}")
+            logger.info("[DRY RUN] would copy cover %s → %s", src, cover_dest)
         else:
             shutil.copy2(str(src), str(cover_dest))
-            logger.info(f"📷 Copied cover → {cover_dest}")
+            logger.info("📷 Copied cover → %s", cover_dest)
         break
 
 
-def _run_tasks(tasks: List[Task], cfg) -> Optional[List[str]]:
-    """Execute tasks sequentially or threaded; return moved-file list or None on error."""
+def _run_tasks(
+    tasks: List[Task],
+    cfg,
+    volume_dir: Path,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> Optional[List[str]]:
+    """Execute tasks sequentially or threaded; return moved-file list or None on error.
+
+    The tasks' archives must already have passed _find_invalid_archives.
+
+    With `cfg.nb_worker > 1` and several tasks, they run on `executor` when
+    given (shared across volumes by the caller), otherwise on a pool created
+    for this call. Tasks run inline extract their members in parallel.
+    """
     total_tasks = len(tasks)
     dry_prefix = "[DRY RUN] " if cfg.dry_run else ""
     moved_files: List[str] = []
 
-    if cfg.nb_worker > 1:
-        logger.debug(f"[info] Using ThreadPoolExecutor with {cfg.nb_worker} workers")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cfg.nb_worker) as ex:
-            futures = {
-                ex.submit(process_one, t.chapter_id, t.src, cfg): (idx, t)
-                for idx, t in enumerate(tasks, 1)
-            }
+    # A lone task gains nothing from a pool; run it inline.
+    if cfg.nb_worker > 1 and total_tasks > 1:
+        logger.debug("[info] Using ThreadPoolExecutor with %d workers", cfg.nb_worker)
+        pool = (
+            contextlib.nullcontext(executor)
+            if executor is not None
+            else concurrent.futures.ThreadPoolExecutor(max_workers=cfg.nb_worker)
+        )
+        with pool as ex:
+            futures = {}
+            for idx, t in enumerate(tasks, 1):
+                fut = ex.submit(
+                    process_one, t.chapter_id, t.src, cfg, volume_dir, validated=True
+                )
+                futures[fut] = (idx, t)
             for fut in concurrent.futures.as_completed(futures):
                 idx, t = futures[fut]
                 logger.info(
-                    f"{dry_prefix}[{idx}/{total_tasks}] Extracting chapter"
-                    f" {t.chapter_id} — {Path(t.src).name}"
+                    "%s[%d/%d] Extracting chapter %s — %s",
+                    dry_prefix,
+                    idx,
+                    total_tasks,
+                    t.chapter_id,
+                    Path(t.src).name,
                 )
                 try:
                     result = fut.result()
@@ -157,79 +378,119 @@ def _run_tasks(tasks: List[Task], cfg) -> Optional[List[str]]:
                         else f"DRY:{result.chapter_id}"
                     )
                     logger.debug(
-                        f"Processed: {(result.chapter_id, result.dest_archive)}"
+                        "Processed: %s", (result.chapter_id, result.dest_archive)
                     )
                 except Exception as e:
-                    logger.error(f"{e}")
+                    logger.error("%s", e)
                     return None
     else:
+        # Chapters run one at a time here, so each spreads its members over
+        # threads instead; on the pool above that would oversubscribe.
+        member_workers = min(_MAX_MEMBER_WORKERS, os.cpu_count() or 1)
         for idx, t in enumerate(tasks, 1):
             logger.info(
-                f"{dry_prefix}[{idx}/{total_tasks}] Extracting chapter"
-                f" {t.chapter_id} — {Path(t.src).name}"
+                "%s[%d/%d] Extracting chapter %s — %s",
+                dry_prefix,
+                idx,
+                total_tasks,
+                t.chapter_id,
+                Path(t.src).name,
             )
             try:
-                result = process_one(t.chapter_id, t.src, cfg)
+                result = process_one(
+                    t.chapter_id,
+                    t.src,
+                    cfg,
+                    volume_dir,
+                    validated=True,
+                    member_workers=member_workers,
+                )
                 moved_files.append(
                     result.dest_archive
                     if not cfg.dry_run
                     else f"DRY:{result.chapter_id}"
                 )
-                logger.debug(f"Processed: {(result.chapter_id, result.dest_archive)}")
+                logger.debug("Processed: %s", (result.chapter_id, result.dest_archive))
             except Exception as e:
-                logger.error(f"{e}")
+                logger.error("%s", e)
                 return None
 
     return moved_files
 
 
+def _lookup_match(
+    pth: str, matches: Dict[str, Optional[ChapterMatch]], cfg
+) -> Optional[ChapterMatch]:
+    """Return the pre-parsed match for *pth*, parsing it if it is not indexed."""
+    if pth in matches:
+        return matches[pth]
+    return extract_chapter_match(pth, cfg.chapter_pat, cfg.extra_pat)
+
+
 def process_volume(
-    volume: int, chapter_range: List[int], available_files: List[str], cfg
+    volume: int,
+    chapter_range: List[int],
+    available_files: List[str],
+    cfg,
+    matches: Optional[Dict[str, Optional[ChapterMatch]]] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> ProcessVolumeResult:
-    """Process a single volume: map files to chapters then execute tasks."""
-    mapping: ChapterToFilesMapping = {}
-    for pth in list(available_files):
-        matches = extract_chapter_number(
-            pth, chapter_pat=cfg.chapter_pat, extra_pat=cfg.extra_pat
+    """Process a single volume: map files to chapters then execute tasks.
+
+    `matches` maps each path to its parsed chapter (as built once per run by
+    scan_cbz_with_chapters); files missing from it are parsed here.
+    `executor` is an optional thread pool reused across volumes.
+    """
+    # Only the requested chapters are checked and planned below, so skip
+    # recording the rest of the directory.
+    wanted = set(chapter_range)
+    mapping: ChapterToFilesMapping
+    if matches is None:
+        mapping = map_chapters_to_files(
+            available_files, wanted, cfg.chapter_pat, cfg.extra_pat
         )
-        for base, extra in matches:
-            entry = mapping.setdefault(base, {"mains": [], "extras": []})
-            if extra is None:
-                entry["mains"].append((None, pth))
-            else:
-                entry["extras"].append((extra, pth))
+    else:
+        pairs = ((pth, _lookup_match(pth, matches, cfg)) for pth in available_files)
+        mapping = group_chapter_matches(pairs, wanted)
 
     for c in chapter_range:
         ch_entry: Optional[dict[str, list]] = mapping.get(c)
         if not ch_entry or (not ch_entry.get("mains") and not ch_entry.get("extras")):
-            logger.error(f"missing chapter {c}")
+            logger.error("missing chapter %s", c)
             return ProcessVolumeResult(MISSING_CHAPTER, available_files)
         if len(ch_entry.get("mains", [])) > 1:
             mains = [p for (_, p) in ch_entry["mains"]]
-            logger.error(f"multiple archives match chapter {c}: {mains}")
+            logger.error("multiple archives match chapter %s: %s", c, mains)
             return ProcessVolumeResult(DUPLICATE_CHAPTER, available_files)
 
     tasks = _plan_tasks(mapping, chapter_range)
 
-    logger.info(f"[info] planned tasks for volume {volume}:")
+    logger.info("[info] planned tasks for volume %s:", volume)
     for t in tasks:
-        logger.info(f"[info]  chapter {t.chapter_id} -> {t.src}")
+        logger.info("[info]  chapter %s -> %s", t.chapter_id, t.src)
+
+    invalid = _find_invalid_archives([t.src for t in tasks], executor)
+    if invalid:
+        for src in invalid:
+            logger.error("Missing ComicInfo.xml in %s", src)
+        return ProcessVolumeResult(PROCESSING_ERROR, available_files)
 
     volume_dir = Path(format_volume_dir(cfg.dest, cfg.serie, volume))
     _ensure_dir(volume_dir, cfg.dry_run)
     _copy_cover(volume_dir, volume, cfg)
 
-    moved_files = _run_tasks(tasks, cfg)
+    moved_files = _run_tasks(tasks, cfg, volume_dir, executor)
     if moved_files is None:
         return ProcessVolumeResult(PROCESSING_ERROR, available_files)
 
     if not cfg.dry_run:
-        for dest in moved_files:
-            if dest and Path(dest).exists():
-                basename = Path(dest).name
-                for orig in list(available_files):
-                    if Path(orig).name == basename:
-                        available_files.remove(orig)
-                        break
+        # One pass over each list instead of a scan of available_files per
+        # moved archive; a directory scan yields unique basenames.
+        moved_names = {
+            Path(dest).name for dest in moved_files if dest and Path(dest).exists()
+        }
+        available_files[:] = [
+            orig for orig in available_files if Path(orig).name not in moved_names
+        ]
 
     return ProcessVolumeResult(SUCCESS, available_files)
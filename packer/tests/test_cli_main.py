@@ -172,6 +172,93 @@ def test_packer_json_provides_nb_worker(tmp_path: Path, make_cbz):
     assert rc == SUCCESS
 
 
+def _capture_nb_worker(monkeypatch) -> list[int]:
+    import packer.cli as cli
+
+    seen: list[int] = []
+    real = cli.process_volume
+
+    def spy(vol, ranges, avail, cfg, *args, **kwargs):
+        seen.append(cfg.nb_worker)
+        return real(vol, ranges, avail, cfg, *args, **kwargs)
+
+    monkeypatch.setattr(cli, "process_volume", spy)
+    return seen
+
+
+def test_nb_worker_defaults_to_io_sized_pool(tmp_path: Path, make_cbz, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    make_cbz(src, "Ch.001.cbz")
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    seen = _capture_nb_worker(monkeypatch)
+    rc = main(_args(src, ["--volume", "1", "--chapter-range", "1"]))
+    assert rc == SUCCESS
+    assert seen == [8]
+
+
+def test_explicit_nb_worker_one_beats_packer_json(
+    tmp_path: Path, make_cbz, monkeypatch
+):
+    src = tmp_path / "src"
+    src.mkdir()
+    make_cbz(src, "Ch.001.cbz")
+    (src / "packer.json").write_text(json.dumps({"nb_worker": 3}))
+    seen = _capture_nb_worker(monkeypatch)
+    rc = main(_args(src, ["--volume", "1", "--chapter-range", "1", "--nb-worker", "1"]))
+    assert rc == SUCCESS
+    assert seen == [1]
+
+
+def test_default_single_chapter_extracts_members_in_parallel(
+    tmp_path: Path, make_cbz, monkeypatch
+):
+    import packer.worker as worker
+
+    src = tmp_path / "src"
+    src.mkdir()
+    make_cbz(src, "Ch.001.cbz")
+    monkeypatch.setattr("os.cpu_count", lambda: 2)
+    seen: list[int] = []
+    real = worker._safe_extract
+
+    def spy(zf, dest, max_workers=1):
+        seen.append(max_workers)
+        return real(zf, dest, max_workers)
+
+    monkeypatch.setattr(worker, "_safe_extract", spy)
+    rc = main(_args(src, ["--volume", "1", "--chapter-range", "1"]))
+    assert rc == SUCCESS
+    assert seen == [2]
+
+
+def test_force_waits_for_background_discard(tmp_path: Path, make_cbz, monkeypatch):
+    import shutil
+    import time
+
+    import packer.worker as worker
+
+    src = tmp_path / "src"
+    src.mkdir()
+    make_cbz(src, "Ch.001.cbz")
+    old = src / "Manga v01" / "Chapter 001"
+    old.mkdir(parents=True)
+    (old / "stale.jpg").write_text("old")
+
+    real_rmtree = shutil.rmtree
+
+    def slow_rmtree(path, *args, **kwargs):
+        time.sleep(0.2)
+        real_rmtree(path, *args, **kwargs)
+
+    monkeypatch.setattr(worker.shutil, "rmtree", slow_rmtree)
+    rc = main(_args(src, ["--volume", "1", "--chapter-range", "1", "--force"]))
+    assert rc == SUCCESS
+    # main() returns only once the renamed-aside tree is gone
+    assert not list(src.glob(".packer-discard-*"))
+    assert not (old / "stale.jpg").exists()
+
+
 # ---------------------------------------------------------------------------
 # --batch valid spec (lines 397-427)
 # ---------------------------------------------------------------------------
@@ -1,6 +1,11 @@
 import re
 
-from packer.core import _match_chapter, _match_extra, extract_chapter_number
+from packer.core import (
+    _match_chapter,
+    _match_extra,
+    extract_chapter_match,
+    extract_chapter_number,
+)
 
 
 def test_match_extra_and_chapter_helpers():
@@ -25,3 +30,10 @@ def test_legacy_patterns():
     assert extract_chapter_number("Chapter 4.5.cbz") == [(4, "5")]
     assert extract_chapter_number("Chapter 4.cbz") == [(4, None)]
     assert extract_chapter_number("Ch.8.cbz") == [(8, None)]
+
+
+def test_extract_chapter_match_single_result():
+    assert extract_chapter_match("Chapter 4.5.cbz") == (4, "5")
+    assert extract_chapter_match("Ch.8.cbz") == (8, None)
+    assert extract_chapter_match("cover.cbz") is None
+    assert extract_chapter_number("cover.cbz") == []
@@ -89,6 +89,15 @@ def test_has_comicinfo_regression_valid_single_entry(tmp_path: Path):
     assert has_comicinfo(cbz) is True
 
 
+def test_has_comicinfo_accepts_open_zipfile(tmp_path: Path):
+    """An already-open ZipFile is inspected in place, without reopening."""
+    cbz = tmp_path / "open.cbz"
+    with zipfile.ZipFile(cbz, "w") as z:
+        z.writestr("ComicInfo.xml", "<ComicInfo></ComicInfo>")
+    with zipfile.ZipFile(cbz, "r") as zf:
+        assert has_comicinfo(zf) is True
+
+
 # ---------------------------------------------------------------------------
 # worker.py — _safe_extract() path traversal (line 25)
 # ---------------------------------------------------------------------------
@@ -108,6 +117,32 @@ def test_safe_extract_path_traversal_raises(tmp_path: Path):
             _safe_extract(zf, dest)
 
 
+@pytest.mark.parametrize("name", ["/abs.jpg", "a/../../b.jpg", "a/..", "..\\b.jpg"])
+def test_safe_extract_rejects_unsafe_names(tmp_path: Path, name: str):
+    archive = tmp_path / "unsafe.cbz"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("001.jpg", "ok")
+        z.writestr(zipfile.ZipInfo(name), "data")
+
+    dest = tmp_path / "output"
+    with zipfile.ZipFile(archive, "r") as zf:
+        with pytest.raises(ValueError, match="Path traversal"):
+            _safe_extract(zf, dest)
+    # validation happens before anything is written
+    assert not dest.exists()
+
+
+def test_safe_extract_allows_dotted_names(tmp_path: Path):
+    archive = tmp_path / "dotted.cbz"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("..cover/a..b.jpg", "ok")
+
+    dest = tmp_path / "output"
+    with zipfile.ZipFile(archive, "r") as zf:
+        _safe_extract(zf, dest)
+    assert (dest / "..cover" / "a..b.jpg").read_text() == "ok"
+
+
 def test_safe_extract_normal_succeeds(tmp_path: Path):
     normal = tmp_path / "normal.cbz"
     with zipfile.ZipFile(normal, "w") as z:
@@ -121,6 +156,37 @@ def test_safe_extract_normal_succeeds(tmp_path: Path):
     assert (dest / "001.jpg").exists()
 
 
+def test_safe_extract_nested_members(tmp_path: Path):
+    """Directory entries and nested members are recreated under *dest*."""
+    nested = tmp_path / "nested.cbz"
+    with zipfile.ZipFile(nested, "w") as z:
+        z.writestr(zipfile.ZipInfo("pages/"), "")
+        z.writestr("pages/001.jpg", "image data")
+        z.writestr("extra/sub/002.jpg", "more data")
+
+    dest = tmp_path / "output"
+    with zipfile.ZipFile(nested, "r") as zf:
+        _safe_extract(zf, dest)
+
+    assert (dest / "pages" / "001.jpg").read_text() == "image data"
+    assert (dest / "extra" / "sub" / "002.jpg").read_text() == "more data"
+
+
+def test_safe_extract_parallel_members(tmp_path: Path):
+    """Concurrent extraction writes every member with its own content."""
+    many = tmp_path / "many.cbz"
+    with zipfile.ZipFile(many, "w", zipfile.ZIP_DEFLATED) as z:
+        for i in range(40):
+            z.writestr(f"pages/{i:03d}.jpg", f"page {i}" * 500)
+
+    dest = tmp_path / "output"
+    with zipfile.ZipFile(many, "r") as zf:
+        _safe_extract(zf, dest, max_workers=4)
+
+    for i in range(40):
+        assert (dest / "pages" / f"{i:03d}.jpg").read_text() == f"page {i}" * 500
+
+
 # ---------------------------------------------------------------------------
 # worker.py — process_one() with bad zip raises RuntimeError (lines 98-99)
 # ---------------------------------------------------------------------------
@@ -197,3 +263,71 @@ def test_threaded_bad_zip_returns_processing_error(tmp_path: Path):
     available = [str(src / "Chapter 001.cbz")]
     rc, _ = process_volume(1, [1], available, cfg)
     assert rc == PROCESSING_ERROR
+
+
+def test_move_archive_falls_back_across_devices(tmp_path: Path, monkeypatch):
+    """A cross-device rename falls back to a copy renamed into place."""
+    import errno
+    import os
+
+    from packer.worker import _move_archive
+
+    src = tmp_path / "a.cbz"
+    src.write_bytes(b"data")
+    dest = tmp_path / "b.cbz"
+
+    real_replace = os.replace
+
+    def fake_replace(a, b):
+        if Path(a) == src:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        real_replace(a, b)
+
+    monkeypatch.setattr(os, "replace", fake_replace)
+    _move_archive(src, dest)
+
+    assert not src.exists()
+    assert dest.read_bytes() == b"data"
+    assert not (tmp_path / "b.cbz.part").exists()
+
+
+def test_move_archive_cleans_partial_copy(tmp_path: Path, monkeypatch):
+    """A failed cross-device copy leaves the source and no .part file."""
+    import errno
+    import os
+    import shutil
+
+    from packer.worker import _move_archive
+
+    src = tmp_path / "a.cbz"
+    src.write_bytes(b"data")
+    dest = tmp_path / "b.cbz"
+
+    def fake_replace(a, b):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    def failing_copy(a, b):
+        Path(b).write_bytes(b"da")
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(os, "replace", fake_replace)
+    monkeypatch.setattr(shutil, "copy2", failing_copy)
+    with pytest.raises(OSError):
+        _move_archive(src, dest)
+
+    assert src.read_bytes() == b"data"
+    assert not dest.exists()
+    assert not (tmp_path / "b.cbz.part").exists()
+
+
+def test_discard_dir_deletes_inline_without_graveyard(tmp_path: Path):
+    """Without a usable graveyard root the dir is removed synchronously."""
+    from packer.worker import _discard_dir
+
+    chap = tmp_path / "vol" / "Chapter 001"
+    chap.mkdir(parents=True)
+    (chap / "001.jpg").write_text("old")
+
+    assert _discard_dir(chap, tmp_path / "missing") is None
+    assert not chap.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["vol"]
@@ -1,11 +1,18 @@
+import io
+import re
 import zipfile
 
+import pytest
+
 from packer.core import (
+    extract_chapter_number,
     find_cbz_files,
     has_comicinfo,
     map_chapters_to_files,
     parse_range,
+    scan_cbz_with_chapters,
 )
+from packer.testing import make_cbz, make_cbz_bytes
 
 
 def test_parse_range_simple():
@@ -13,6 +20,19 @@ def test_parse_range_simple():
     assert parse_range("1,3,5..6") == [1, 3, 5, 6]
 
 
+@pytest.mark.parametrize("text", ["a", "1..", "..3", "1-3", "3..1"])
+def test_parse_range_rejects_malformed_parts(text):
+    with pytest.raises(ValueError, match="Invalid range"):
+        parse_range(text)
+
+
+def test_parse_range_cached_result_is_not_shared():
+    first = parse_range("2..4")
+    first.append(99)
+    assert parse_range("2..4") == [2, 3, 4]
+    assert parse_range("3,1..2,2") == [1, 2, 3]
+
+
 def test_has_comicinfo_true(tmp_path):
     p = tmp_path / "c1.cbz"
     with zipfile.ZipFile(p, "w") as z:
@@ -41,3 +61,94 @@ def test_find_and_map(tmp_path):
     assert 1 in mapping
     assert 2 in mapping
     assert 10 in mapping
+
+
+def test_map_chapters_to_files_wanted_filter():
+    files = ["Chapter 1.cbz", "Chapter 2.cbz", "Chapter 2.5.cbz", "Chapter 3.cbz"]
+    mapping = map_chapters_to_files(files, wanted={2})
+    assert list(mapping) == [2]
+    assert mapping[2]["mains"] == [(None, "Chapter 2.cbz")]
+    assert mapping[2]["extras"] == [("5", "Chapter 2.5.cbz")]
+
+
+def test_map_chapters_to_files_matches_per_file_parsing():
+    files = [
+        "dir/Chapter 7.cbz",
+        "Ch.12.5.cbz",
+        "no marker.cbz",
+        "Serie ch",  # separators must not reach into the next name
+        "5 Chapter-003.cbz",
+        "odd\nch 9.cbz",
+    ]
+    mapping = map_chapters_to_files(files)
+    expected: dict = {}
+    for p in files:
+        for m in extract_chapter_number(p):
+            entry = expected.setdefault(m.base, {"mains": [], "extras": []})
+            key = "mains" if m.extra is None else "extras"
+            entry[key].append((m.extra, p))
+    assert mapping == expected
+    assert map_chapters_to_files(files[:-1]) == {
+        k: v for k, v in expected.items() if k != 9
+    }
+
+
+def test_scan_cbz_with_chapters(tmp_path):
+    for name in ("Chapter 1.cbz", "Ch.2.5.CBZ", "cover.cbz", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "sub.cbz").mkdir()
+
+    scanned = dict(scan_cbz_with_chapters(str(tmp_path)))
+    assert sorted(scanned) == sorted(
+        str(tmp_path / n) for n in ("Chapter 1.cbz", "Ch.2.5.CBZ", "cover.cbz")
+    )
+    assert scanned[str(tmp_path / "Chapter 1.cbz")] == (1, None)
+    assert scanned[str(tmp_path / "Ch.2.5.CBZ")] == (2, "5")
+    assert scanned[str(tmp_path / "cover.cbz")] is None
+
+
+def test_scan_cbz_with_chapters_batch_parses_default_pattern(tmp_path, monkeypatch):
+    import packer.core as core
+
+    for name in ("Chapter 1.cbz", "Chapter 2.cbz"):
+        (tmp_path / name).write_bytes(b"")
+    calls = []
+    real = core._legacy_chapter_matches
+
+    def spy(paths):
+        calls.append(len(paths))
+        return real(paths)
+
+    monkeypatch.setattr(core, "_legacy_chapter_matches", spy)
+    scanned = dict(scan_cbz_with_chapters(str(tmp_path)))
+    assert calls == [2]
+    assert scanned[str(tmp_path / "Chapter 2.cbz")] == (2, None)
+
+    # custom patterns parse each name on its own
+    calls.clear()
+    dict(scan_cbz_with_chapters(str(tmp_path), chapter_pat=re.compile(r"(\d+)")))
+    assert calls == []
+
+
+def test_map_chapters_to_files_custom_patterns():
+    import re
+
+    chapter_pat = re.compile(r"(?i)chap(?:itre)?[\s._-]*0*([0-9]+)")
+    extra_pat = re.compile(r"(?i)chap(?:itre)?[\s._-]*0*([0-9]+)\.([0-9]+)")
+    files = ["Chapitre 3.cbz", "Chapitre 3.5.cbz", "Chapter 4.cbz"]
+    mapping = map_chapters_to_files(files, chapter_pat=chapter_pat, extra_pat=extra_pat)
+    assert mapping[3] == {
+        "mains": [(None, "Chapitre 3.cbz")],
+        "extras": [("5", "Chapitre 3.5.cbz")],
+    }
+    # names the custom patterns miss still fall back to the legacy pattern
+    assert mapping[4]["mains"] == [(None, "Chapter 4.cbz")]
+
+
+def test_make_cbz_bytes_is_a_valid_archive(tmp_path):
+    with zipfile.ZipFile(io.BytesIO(make_cbz_bytes())) as z:
+        assert set(z.namelist()) == {"ComicInfo.xml", "001.jpg"}
+    with zipfile.ZipFile(io.BytesIO(make_cbz_bytes(False))) as z:
+        assert z.namelist() == ["001.jpg"]
+    p = make_cbz(tmp_path, "ch1.cbz")
+    assert p.read_bytes() == make_cbz_bytes()
@@ -1,6 +1,9 @@
 import os
+import threading
 from pathlib import Path
 
+import pytest
+
 from packer.cli import Config
 from packer.testing import make_cbz
 from packer.worker import process_one, process_volume
@@ -43,6 +46,34 @@ def test_process_one_normal(tmp_path: Path):
     assert (chap_dir / "001.jpg").exists()
 
 
+def test_process_one_uses_given_volume_dir(tmp_path: Path):
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    volume_dir = dest / "Custom v07"
+    volume_dir.mkdir(parents=True)
+
+    src_file = make_cbz(src, "Chapter 1.cbz")
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1],
+        nb_worker=1,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    cid, moved = process_one("1", src_file, cfg, volume_dir)
+    assert Path(moved).parent == volume_dir
+    assert (volume_dir / "Chapter 001" / "001.jpg").exists()
+    # the cfg-derived volume dir is not created when one is given
+    assert not (dest / "S v01").exists()
+
+
 def test_process_one_dry_run(tmp_path: Path):
     src = tmp_path / "src"
     src.mkdir()
@@ -70,7 +101,9 @@ def test_process_one_dry_run(tmp_path: Path):
     assert not (dest / "S v01" / "Chapter 002").exists()
 
 
-def test_process_one_force_overwrite(tmp_path: Path):
+def test_process_one_force_overwrite(tmp_path: Path, monkeypatch):
+    import packer.worker as worker
+
     src = tmp_path / "src"
     src.mkdir()
     dest = tmp_path / "dest"
@@ -97,12 +130,54 @@ def test_process_one_force_overwrite(tmp_path: Path):
         force=True,
     )
 
+    threads = []
+    real = worker._discard_dir
+
+    def spy(path, graveyard_root):
+        threads.append(real(path, graveyard_root))
+        return threads[-1]
+
+    monkeypatch.setattr(worker, "_discard_dir", spy)
     cid, moved = process_one("3", src_file, cfg)
     assert cid == "3"
     # the previous marker should be gone
     assert not (chap_dir / "keep.txt").exists()
     # new extracted file must be present
     assert (chap_dir / "001.jpg").exists()
+    # the old tree leaves the volume dir and is deleted in the background
+    assert sorted(p.name for p in vol_dir.iterdir()) == ["Chapter 003", "Chapter 3.cbz"]
+    [thread] = threads
+    assert thread is not None
+    worker.wait_for_discards()
+    assert not thread.is_alive()
+    assert sorted(p.name for p in dest.iterdir()) == ["S v01"]
+
+
+def test_process_one_force_dry_run_keeps_chapter_dir(tmp_path: Path):
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    chap_dir = dest / "S v01" / "Chapter 003"
+    chap_dir.mkdir(parents=True)
+    (chap_dir / "keep.txt").write_text("old")
+
+    src_file = make_cbz(src, "Chapter 3.cbz")
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[3],
+        nb_worker=1,
+        dry_run=True,
+        verbose=False,
+        force=True,
+    )
+
+    process_one("3", src_file, cfg)
+    assert (chap_dir / "keep.txt").read_text() == "old"
+    assert os.path.exists(src_file)
 
 
 def test_process_one_skip_if_chapter_exists(tmp_path: Path):
@@ -223,3 +298,231 @@ def test_process_volume_duplicate_mains_returns_4(tmp_path: Path):
     avail = [str(p) for p in src.iterdir()]
     rc, remaining = process_volume(1, [1], avail, cfg)
     assert rc == 4
+
+
+def test_process_volume_invalid_archive_moves_nothing(tmp_path: Path):
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    make_cbz(src, "Chapter 1.cbz")
+    make_cbz(src, "Chapter 2.cbz", include_comicinfo=False)
+    make_cbz(src, "Chapter 3.cbz")
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1, 2, 3],
+        nb_worker=1,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    avail = [str(p) for p in src.iterdir()]
+    rc, remaining = process_volume(1, [1, 2, 3], avail, cfg)
+    assert rc == 6
+    # the preflight rejects the volume before any archive is moved
+    assert len(list(src.iterdir())) == 3
+    assert not (dest / "S v01").exists()
+
+
+def test_process_volume_reuses_given_executor(tmp_path: Path):
+    import concurrent.futures
+
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    files = [str(make_cbz(src, f"Chapter {i}.cbz")) for i in (1, 2, 3, 4)]
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1, 2],
+        nb_worker=2,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        rc, remaining = process_volume(1, [1, 2], files, cfg, executor=ex)
+        assert rc == 0
+        rc, remaining = process_volume(2, [3, 4], remaining, cfg, executor=ex)
+        assert rc == 0
+        # the shared pool is still usable after both volumes
+        assert ex.submit(lambda: 42).result() == 42
+
+    assert not remaining
+    assert (dest / "S v01" / "Chapter 002" / "001.jpg").exists()
+    assert (dest / "S v02" / "Chapter 004" / "001.jpg").exists()
+
+
+def test_process_volume_single_task_runs_inline(tmp_path: Path, monkeypatch):
+    import packer.worker as worker
+
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    files = [str(make_cbz(src, "Chapter 1.cbz"))]
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1],
+        nb_worker=4,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    calls = []
+    real = worker.process_one
+
+    def spy(*args, **kwargs):
+        calls.append((threading.current_thread(), kwargs.get("member_workers", 1)))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(worker, "process_one", spy)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    rc, remaining = process_volume(1, [1], files, cfg)
+    assert rc == 0
+    assert (dest / "S v01" / "Chapter 001" / "001.jpg").exists()
+    # the lone chapter runs on the calling thread and extracts in parallel
+    assert calls == [(threading.main_thread(), 4)]
+
+
+def test_process_volume_pooled_tasks_extract_serially(tmp_path: Path, monkeypatch):
+    import packer.worker as worker
+
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    files = [str(make_cbz(src, f"Chapter {i}.cbz")) for i in (1, 2)]
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1, 2],
+        nb_worker=4,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    member_workers = []
+    real = worker.process_one
+
+    def spy(*args, **kwargs):
+        member_workers.append(kwargs.get("member_workers", 1))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(worker, "process_one", spy)
+    rc, _ = process_volume(1, [1, 2], files, cfg)
+    assert rc == 0
+    assert member_workers == [1, 1]
+
+
+def test_process_volume_checks_comicinfo_once_per_archive(tmp_path: Path, monkeypatch):
+    import packer.worker as worker
+
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    files = [str(make_cbz(src, f"Chapter {i}.cbz")) for i in (1, 2)]
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1, 2],
+        nb_worker=1,
+        dry_run=False,
+        verbose=False,
+        force=False,
+    )
+
+    checked = []
+    real = worker.has_comicinfo
+
+    def spy(cbz):
+        checked.append(cbz)
+        return real(cbz)
+
+    monkeypatch.setattr(worker, "has_comicinfo", spy)
+    rc, _ = process_volume(1, [1, 2], list(files), cfg)
+    assert rc == 0
+    # the preflight probes each archive; process_one does not re-check
+    assert checked == files
+
+
+def test_process_volume_preflight_uses_given_executor(tmp_path: Path):
+    import concurrent.futures
+
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    files = [str(make_cbz(src, f"Chapter {i}.cbz")) for i in (1, 2)]
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1, 2],
+        nb_worker=1,
+        dry_run=True,
+        verbose=False,
+        force=False,
+    )
+
+    class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+        mapped = 0
+
+        def map(self, *args, **kwargs):
+            CountingExecutor.mapped += 1
+            return super().map(*args, **kwargs)
+
+    with CountingExecutor(max_workers=2) as ex:
+        rc, _ = process_volume(1, [1, 2], files, cfg, executor=ex)
+    assert rc == 0
+    assert CountingExecutor.mapped == 1
+
+
+def test_process_one_validated_skips_comicinfo_check(tmp_path: Path):
+    src = tmp_path / "src"
+    src.mkdir()
+    dest = tmp_path / "dest"
+    src_file = make_cbz(src, "Chapter 1.cbz", include_comicinfo=False)
+
+    cfg = Config(
+        path=str(src),
+        dest=str(dest),
+        serie="S",
+        volume=1,
+        chapter_range=[1],
+        nb_worker=1,
+        dry_run=True,
+        verbose=False,
+        force=False,
+    )
+
+    # direct callers keep the check
+    with pytest.raises(RuntimeError, match="Missing ComicInfo.xml"):
+        process_one("1", str(src_file), cfg)
+    assert process_one("1", str(src_file), cfg, validated=True).chapter_id == "1"